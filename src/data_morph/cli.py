@@ -1,6 +1,7 @@
 """Run Data Morph CLI from start shape to end shape preserving summary statistics."""
 
 import argparse
+import functools
 import sys
 from typing import Sequence, Union
 
@@ -206,6 +207,19 @@ def generate_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for the CLI once and cache it for reuse.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Cached argument parser for the CLI.
+    """
+    return generate_parser()
+
+
 def main(argv: Union[Sequence[str], None] = None) -> None:
     """
     Run Data Morph as a script.
@@ -217,7 +231,7 @@ def main(argv: Union[Sequence[str], None] = None) -> None:
         the command line.
     """
 
-    args = generate_parser().parse_args(argv)
+    args = _get_parser().parse_args(argv)
 
     target_shapes = (
         ShapeFactory.AVAILABLE_SHAPES
@@ -6,6 +6,28 @@ import pandas as pd
 import pytest
 
 
+def pytest_addoption(parser):
+    """Add the --all-combinations option for exhaustive input validation runs."""
+    parser.addoption(
+        '--all-combinations',
+        action='store_true',
+        default=False,
+        help=(
+            'Run input validation tests over the full Cartesian product of inputs '
+            'instead of a covering sample.'
+        ),
+    )
+    parser.addoption(
+        '--full-shape-registry',
+        action='store_true',
+        default=False,
+        help=(
+            "Run 'all shapes' CLI tests against the full shape registry "
+            'instead of a pruned one.'
+        ),
+    )
+
+
 @pytest.fixture(scope='session')
 def sample_data():
     """Fixture for the sample data."""
@@ -1,13 +1,142 @@
 """Test the CLI."""
 
+import functools
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
 from data_morph import __version__, cli
 from data_morph.data.dataset import Dataset
 
-pytestmark = pytest.mark.cli
+pytestmark = [pytest.mark.cli, pytest.mark.xdist_group(name='cli')]
+
+BOOLEAN_FIELDS = ('ramp-in', 'ramp-out', 'forward-only', 'keep-frames')
+BOOLEAN_VALUES = (1, 0, 's', -1, 0.5, True, False)
+BOOLEAN_COVERING_PAIRS = tuple(
+    (BOOLEAN_FIELDS[i % len(BOOLEAN_FIELDS)], value)
+    for i, value in enumerate(BOOLEAN_VALUES)
+)
+
+INTEGER_ERRORS = {
+    field: f'error: argument --{field}: invalid int value:'
+    for field in ('iterations', 'freeze', 'seed')
+}
+BOOLEAN_ERRORS = {
+    field: f'error: argument --{field}: ignored explicit argument'
+    for field in BOOLEAN_FIELDS
+}
+
+# static CLI arguments for test_cli_one_shape keyed by its flag parameter;
+# these mirror the init_args/morph_args dicts checked in that test
+ONE_SHAPE_ARGV = {
+    True: (
+        '--target-shape=circle',
+        '--iterations=1000',
+        '--decimals=3',
+        '--seed=1',
+        '--write-data',
+        '--keep-frames',
+        '--forward-only',
+        '--shake=0.5',
+        '--freeze=3',
+        '--ramp-in',
+        '--ramp-out',
+    ),
+    False: (
+        '--target-shape=circle',
+        '--iterations=1000',
+        '--seed=1',
+    ),
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _expected_morph_stderr(n):
+    """Build the expected 'Morphing shape i of n' stderr output for n shapes."""
+    return ''.join(f'Morphing shape {i + 1} of {n}\n' for i in range(n))
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize Boolean validation with a covering sample unless --all-combinations is passed."""
+    if metafunc.definition.name != 'test_cli_bad_input_boolean':
+        return
+    if metafunc.config.getoption('--all-combinations'):
+        pairs = [(field, value) for field in BOOLEAN_FIELDS for value in BOOLEAN_VALUES]
+    else:
+        pairs = list(BOOLEAN_COVERING_PAIRS)
+    metafunc.parametrize(['field', 'value'], pairs)
+
+
+@pytest.fixture(scope='module', autouse=True)
+def _prime_parser_cache():
+    """Build the CLI argument parser once so every test reuses the cached instance."""
+    cli._get_parser()
+
+
+@pytest.fixture(scope='module')
+def parser(_prime_parser_cache):
+    """The cached CLI argument parser."""
+    return cli._get_parser()
+
+
+@pytest.fixture(scope='module')
+def _patched_morph():
+    """Patch DataMorpher.morph and DataLoader.load_dataset once for the module."""
+    with mock.patch.object(
+        cli.DataMorpher, 'morph', spec_set=cli.DataMorpher.morph
+    ) as morph_mock:
+        with mock.patch.object(
+            cli.DataLoader,
+            'load_dataset',
+            spec_set=cli.DataLoader.load_dataset,
+            side_effect=cli.DataLoader.load_dataset,
+        ) as load_mock:
+            yield morph_mock, load_mock
+
+
+@pytest.fixture(scope='module')
+def _patched_morpher_init():
+    """Patch DataMorpher.__init__ once for the module against the real signature."""
+    with mock.patch.object(
+        cli.DataMorpher,
+        '__init__',
+        spec_set=cli.DataMorpher.__init__,
+        return_value=None,
+    ) as init_mock:
+        yield init_mock
+
+
+@pytest.fixture
+def morpher_init(_patched_morpher_init):
+    """Provide the shared DataMorpher.__init__ mock, reset for each test."""
+    _patched_morpher_init.reset_mock()
+    return _patched_morpher_init
+
+
+@pytest.fixture
+def patched_morph(_patched_morph):
+    """Provide the shared morph and load_dataset mocks, reset for each test."""
+    morph_mock, load_mock = _patched_morph
+    morph_mock.reset_mock()
+    load_mock.reset_mock()
+    return morph_mock, load_mock
+
+
+@pytest.fixture(scope='module')
+def _all_shapes():
+    """Snapshot the full shape registry once for the module."""
+    return tuple(cli.ShapeFactory.AVAILABLE_SHAPES)
+
+
+@pytest.fixture
+def small_shape_registry(request, monkeypatch, _all_shapes):
+    """Prune the shape registry for 'all shapes' runs unless --full-shape-registry is passed."""
+    if request.config.getoption('--full-shape-registry'):
+        return _all_shapes
+    options = ['dots', 'x']
+    monkeypatch.setattr(cli.ShapeFactory, 'AVAILABLE_SHAPES', options)
+    return options
 
 
 @pytest.fixture(scope='module', params=['dino', 'sheep.csv'])
@@ -37,85 +166,67 @@ def test_cli_bad_shape():
 
 
 @pytest.mark.input_validation
-@pytest.mark.parametrize(
-    ['decimals', 'reason'],
-    [
+def test_cli_bad_input_decimals(parser, capsys):
+    """Test that invalid input for decimals is handled correctly."""
+    for decimals, reason in [
         (-1, 'invalid choice'),
         (0.5, 'invalid int value'),
         (10, 'invalid choice'),
         ('s', 'invalid int value'),
-    ],
-)
-def test_cli_bad_input_decimals(decimals, reason, capsys):
-    """Test that invalid input for decimals is handled correctly."""
-    with pytest.raises(SystemExit):
-        cli.main(['--start-shape=dino', f'--decimals={decimals}'])
-    assert f'error: argument --decimals: {reason}:' in capsys.readouterr().err
+    ]:
+        with pytest.raises(SystemExit):
+            parser.parse_args(['--start-shape=dino', f'--decimals={decimals}'])
+        assert f'error: argument --decimals: {reason}:' in capsys.readouterr().err
 
 
 @pytest.mark.input_validation
-@pytest.mark.parametrize(
-    ['value', 'reason'],
-    [
-        ('--', 'expected one argument'),
-        ('s', 'invalid float value'),
-    ],
-)
-@pytest.mark.parametrize('field', ['shake', 'scale'])
-def test_cli_bad_input_floats(field, value, reason, capsys):
+def test_cli_bad_input_floats(parser, capsys):
     """Test that invalid input for floats is handled correctly."""
-    with pytest.raises(SystemExit):
-        cli.main([f'--{field}', value, '--start-shape=dino'])
-    assert f'error: argument --{field}: {reason}' in capsys.readouterr().err
+    for field in ['shake', 'scale']:
+        for value, reason in [
+            ('--', 'expected one argument'),
+            ('s', 'invalid float value'),
+        ]:
+            with pytest.raises(SystemExit):
+                parser.parse_args([f'--{field}', value, '--start-shape=dino'])
+            assert f'error: argument --{field}: {reason}' in capsys.readouterr().err
 
 
 @pytest.mark.input_validation
-@pytest.mark.parametrize('value', [True, False, 0.1, 's'])
-@pytest.mark.parametrize('field', ['iterations', 'freeze', 'seed'])
-def test_cli_bad_input_integers(field, value, capsys):
+def test_cli_bad_input_integers(parser, capsys):
     """Test that invalid input for integers is handled correctly."""
-    with pytest.raises(SystemExit):
-        cli.main(['--start-shape=dino', f'--{field}={value}'])
-    assert f'error: argument --{field}: invalid int value:' in capsys.readouterr().err
+    for field, expected_error in INTEGER_ERRORS.items():
+        for value in [True, False, 0.1, 's']:
+            with pytest.raises(SystemExit):
+                parser.parse_args(['--start-shape=dino', f'--{field}={value}'])
+            assert expected_error in capsys.readouterr().err
 
 
 @pytest.mark.input_validation
-@pytest.mark.parametrize('value', [1, 0, 's', -1, 0.5, True, False])
-@pytest.mark.parametrize(
-    'field', ['ramp-in', 'ramp-out', 'forward-only', 'keep-frames']
-)
-def test_cli_bad_input_boolean(field, value, capsys):
+def test_cli_bad_input_boolean(field, value, parser, capsys):
     """Test that invalid input for Boolean switches are handled correctly."""
     with pytest.raises(SystemExit):
-        cli.main(['--start-shape=dino', f'--{field}={value}'])
-    assert (
-        f'error: argument --{field}: ignored explicit argument'
-        in capsys.readouterr().err
-    )
+        parser.parse_args(['--start-shape=dino', f'--{field}={value}'])
+    assert BOOLEAN_ERRORS[field] in capsys.readouterr().err
 
 
 @pytest.mark.parametrize(
     ['start_shape', 'scale'],
     [['dino', 10], ['dino', 0.5], ['dino', None]],
 )
-def test_cli_dataloader(start_shape, scale, mocker):
+def test_cli_dataloader(start_shape, scale, patched_morph):
     """Check that the DataLoader is being used correctly."""
 
-    bound_args = ['--scale', str(scale)] if scale else []
-
-    load = mocker.patch.object(cli.DataLoader, 'load_dataset', autospec=True)
-    _ = mocker.patch.object(cli.DataMorpher, 'morph')
-    argv = [
-        f'--start-shape={start_shape}',
-        '--target-shape=circle',
-        *bound_args,
-    ]
-    cli.main([arg for arg in argv if arg])
+    _, load = patched_morph
+    argv = [f'--start-shape={start_shape}', '--target-shape=circle']
+    if scale:
+        argv.extend(['--scale', str(scale)])
+    cli.main(argv)
     load.assert_called_once_with(start_shape, scale=scale)
 
 
 @pytest.mark.parametrize('flag', [True, False])
-def test_cli_one_shape(start_shape, flag, mocker, tmp_path):
+def test_cli_one_shape(start_shape, flag, patched_morph, morpher_init, tmp_path):
     """Check that the proper values are passed to morph a single shape."""
     init_args = {
         'decimals': 3 if flag else None,
@@ -137,26 +248,15 @@ def test_cli_one_shape(start_shape, flag, mocker, tmp_path):
         'ramp_out': flag,
     }
 
-    morpher_init = mocker.patch.object(cli.DataMorpher, '__init__', autospec=True)
-    morpher_init.return_value = None
-    morph_mock = mocker.patch.object(cli.DataMorpher, 'morph', autospec=True)
-
-    argv = [
-        f'--start-shape={morph_args["start_shape_name"]}',
-        f'--target-shape={morph_args["target_shape"]}',
-        f'--iterations={morph_args["iterations"]}',
-        f'--decimals={init_args["decimals"]}' if init_args['decimals'] else '',
-        f'--seed={init_args["seed"]}',
-        f'--output-dir={init_args["output_dir"]}',
-        '--write-data' if init_args['write_data'] else '',
-        '--keep-frames' if init_args['keep_frames'] else '',
-        '--forward-only' if init_args['forward_only_animation'] else '',
-        f'--shake={morph_args["min_shake"]}' if morph_args['min_shake'] else '',
-        f'--freeze={morph_args["freeze"]}' if morph_args['freeze'] else '',
-        '--ramp-in' if morph_args['ramp_in'] else '',
-        '--ramp-out' if morph_args['ramp_out'] else '',
-    ]
-    cli.main([arg for arg in argv if arg])
+    morph_mock, _ = patched_morph
+
+    cli.main(
+        [
+            f'--start-shape={morph_args["start_shape_name"]}',
+            f'--output-dir={init_args["output_dir"]}',
+            *ONE_SHAPE_ARGV[flag],
+        ]
+    )
 
     morpher_init.assert_called_once()
     for arg, value in init_args.items():
@@ -179,11 +279,8 @@ def test_cli_one_shape(start_shape, flag, mocker, tmp_path):
 
 
 @pytest.mark.parametrize(
-    ['target_shape', 'patched_options'],
-    [
-        (['star', 'bullseye'], None),
-        (['all'], ['dots', 'x']),
-    ],
+    'target_shape',
+    [['star', 'bullseye'], ['all']],
     ids=['two shapes', 'all shapes'],
 )
 @pytest.mark.parametrize(
@@ -198,35 +295,27 @@ def test_cli_one_shape(start_shape, flag, mocker, tmp_path):
     indirect=True,
     ids=str,
 )
-def test_cli_multiple_shapes(
-    start_shape, target_shape, patched_options, monkeypatch, mocker, capsys
-):
+def test_cli_multiple_shapes(start_shape, target_shape, request, patched_morph, capsys):
     """Check that multiple morphing is working."""
 
-    if patched_options:
-        monkeypatch.setattr(
-            cli.ShapeFactory,
-            'AVAILABLE_SHAPES',
-            patched_options,
-        )
+    shapes = (
+        request.getfixturevalue('small_shape_registry')
+        if 'all' in target_shape
+        else target_shape
+    )
 
-    shapes = patched_options or target_shape
+    num_shapes = len(shapes)
 
-    morph_noop = mocker.patch.object(cli.DataMorpher, 'morph', autospec=True)
+    morph_noop, _ = patched_morph
     cli.main(['--start-shape', *start_shape, '--target-shape', *target_shape])
-    assert morph_noop.call_count == len(shapes) * len(start_shape)
+    assert morph_noop.call_count == num_shapes * len(start_shape)
 
     err = capsys.readouterr().err
-    assert (
-        ''.join(
-            [f'Morphing shape {i + 1} of {len(shapes)}\n' for i in range(len(shapes))]
-        )
-        in err
-    )
+    assert _expected_morph_stderr(num_shapes) in err
     for shape in start_shape:
         assert Path(shape).stem in err
 
     patterns_run = [
         str(kwargs['target_shape']) for _, kwargs in morph_noop.call_args_list
     ]
-    assert set(shapes).difference(patterns_run) == set()
+    assert set(patterns_run).issuperset(shapes)